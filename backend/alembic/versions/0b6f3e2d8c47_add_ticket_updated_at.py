@@ -0,0 +1,37 @@
+"""Add tickets.updated_at
+
+Revision ID: 0b6f3e2d8c47
+Revises: e7b2c5d9a014
+Create Date: 2026-10-15 12:18:52.906431
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b6f3e2d8c47'
+down_revision: Union[str, Sequence[str], None] = 'e7b2c5d9a014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite's ADD COLUMN rejects non-constant defaults, so recreate the table
+    with op.batch_alter_table('tickets', recreate='always') as batch_op:
+        batch_op.add_column(sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True))
+    op.execute("UPDATE tickets SET updated_at = created_at")
+    with op.batch_alter_table('tickets') as batch_op:
+        batch_op.alter_column('updated_at',
+               existing_type=sa.DateTime(timezone=True),
+               existing_server_default=sa.func.now(),
+               nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('tickets') as batch_op:
+        batch_op.drop_column('updated_at')
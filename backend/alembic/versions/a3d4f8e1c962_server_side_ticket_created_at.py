@@ -0,0 +1,39 @@
+"""Stamp tickets.created_at server-side
+
+Revision ID: a3d4f8e1c962
+Revises: 5c1e9a3f7b20
+Create Date: 2026-10-15 11:03:27.540119
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3d4f8e1c962'
+down_revision: Union[str, Sequence[str], None] = '5c1e9a3f7b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("UPDATE tickets SET created_at = CURRENT_TIMESTAMP WHERE created_at IS NULL")
+    with op.batch_alter_table('tickets') as batch_op:
+        batch_op.alter_column('created_at',
+               existing_type=sa.DateTime(),
+               type_=sa.DateTime(timezone=True),
+               server_default=sa.func.now(),
+               nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('tickets') as batch_op:
+        batch_op.alter_column('created_at',
+               existing_type=sa.DateTime(timezone=True),
+               type_=sa.DateTime(),
+               server_default=None,
+               nullable=True)
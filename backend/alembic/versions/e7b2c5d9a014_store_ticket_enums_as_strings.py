@@ -0,0 +1,48 @@
+"""Store ticket status and priority as plain strings
+
+Revision ID: e7b2c5d9a014
+Revises: a3d4f8e1c962
+Create Date: 2026-10-15 11:41:09.273651
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b2c5d9a014'
+down_revision: Union[str, Sequence[str], None] = 'a3d4f8e1c962'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # sa.Enum persisted member names ('IN_PROGRESS'); the columns now hold values ('in_progress')
+    op.execute("UPDATE tickets SET status = lower(coalesce(status, 'OPEN'))")
+    op.execute("UPDATE tickets SET priority = lower(coalesce(priority, 'MEDIUM'))")
+    with op.batch_alter_table('tickets') as batch_op:
+        batch_op.alter_column('status',
+               existing_type=sa.Enum('OPEN', 'IN_PROGRESS', 'CLOSED', name='ticketstatus'),
+               type_=sa.String(length=16),
+               nullable=False)
+        batch_op.alter_column('priority',
+               existing_type=sa.Enum('LOW', 'MEDIUM', 'HIGH', name='ticketpriority'),
+               type_=sa.String(length=16),
+               nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('tickets') as batch_op:
+        batch_op.alter_column('priority',
+               existing_type=sa.String(length=16),
+               type_=sa.Enum('LOW', 'MEDIUM', 'HIGH', name='ticketpriority'),
+               nullable=True)
+        batch_op.alter_column('status',
+               existing_type=sa.String(length=16),
+               type_=sa.Enum('OPEN', 'IN_PROGRESS', 'CLOSED', name='ticketstatus'),
+               nullable=True)
+    op.execute("UPDATE tickets SET status = upper(status), priority = upper(priority)")
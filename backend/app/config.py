@@ -1,16 +1,52 @@
 from pydantic_settings import BaseSettings
 from pydantic import Field
 from pathlib import Path
+from functools import lru_cache
 
 
 class Settings(BaseSettings):
     database_url: str = Field(
-        default="sqlite:///./tickets.db",
+        default="sqlite+aiosqlite:///./tickets.db",
         description="Database connection URL"
     )
+    db_pool_size: int = Field(
+        default=10,
+        description="Number of connections kept open in the pool"
+    )
+    db_max_overflow: int = Field(
+        default=20,
+        description="Extra connections allowed beyond the pool size under load"
+    )
+    db_pool_timeout: int = Field(
+        default=30,
+        description="Seconds to wait for a free connection before giving up"
+    )
+    db_pool_recycle: int = Field(
+        default=3600,
+        description="Seconds after which a pooled connection is recycled"
+    )
+    db_pool_pre_ping: bool = Field(
+        default=True,
+        description="Test connections for liveness on checkout"
+    )
+    host: str = Field(
+        default="0.0.0.0",
+        description="Interface the API server binds to"
+    )
+    port: int = Field(
+        default=8000,
+        description="Port the API server listens on"
+    )
+    raiseload_strict: bool = Field(
+        default=False,
+        description="Raise on unintended lazy relationship loads (enable outside production)"
+    )
 
     class Config:
         env_file = Path(__file__).parent.parent.parent / ".env"
         case_sensitive = False
 
-settings = Settings()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    # parse env / .env once; usable as Depends(get_settings) and overridable in tests
+    return Settings()
@@ -1,25 +1,48 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
-from app.config import settings
+from typing import AsyncGenerator
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import declarative_base
+from app.config import get_settings
 
-# Create SQLAlchemy engine
-engine = create_engine(
+settings = get_settings()
+
+# Create async SQLAlchemy engine (sqlite+aiosqlite) with a pool of warm connections.
+# LIFO checkout keeps the most recently used connections hot.
+engine = create_async_engine(
     settings.database_url,
-    connect_args={"check_same_thread": False}
+    connect_args={"check_same_thread": False},
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=settings.db_pool_pre_ping,
+    pool_use_lifo=True
 )
 
-# Create SessionLocal class for database sessions.
-SessionLocal = sessionmaker(
-    autocommit=False,
+# Tune every new SQLite connection: WAL lets readers run alongside a writer,
+# synchronous=NORMAL drops an fsync per commit, and a larger page cache / mmap
+# keeps hot pages in memory.
+@event.listens_for(engine.sync_engine, "connect")
+def _set_sqlite_pragmas(dbapi_conn, _):
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+# Create async_session factory for database sessions.
+async_session = async_sessionmaker(
+    bind=engine,
     autoflush=False,
-    bind=engine
+    expire_on_commit=False
 )
 
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    async with async_session() as db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
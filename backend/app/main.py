@@ -1,8 +1,22 @@
+import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from app.config import get_settings
 from app.routers import tickets, auth
 from app.models import user, ticket 
-app = FastAPI()
+
+logging.basicConfig(level=logging.INFO)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # build the OpenAPI schema once up front; app.openapi() caches it on app.openapi_schema
+    app.openapi()
+    yield
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 app.include_router(tickets.router)
 app.include_router(auth.router)
 
@@ -11,8 +25,9 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # In production, specify your frontend domain
     allow_credentials=True,
-    allow_methods=["*"],  # Allows GET, POST, PUT, DELETE, etc.
-    allow_headers=["*"],  # Allows all headers
+    allow_methods=["GET", "POST", "PUT", "DELETE"],  # Explicit lists skip the "*" expansion on preflight
+    allow_headers=["authorization", "content-type", "if-none-match"],
+    expose_headers=["etag"],  # Lets the frontend read ticket ETags
 )
 
 @app.get("/")
@@ -21,4 +36,17 @@ def read_root():
 
 @app.get("/health")
 def health_check():
-    return {"status": "healthy"}
\ No newline at end of file
+    return {"status": "healthy"}
+
+
+if __name__ == "__main__":
+    import importlib.util
+    import uvicorn
+
+    # uvloop (libuv event loop) and httptools (C HTTP parser) ship with uvicorn[standard];
+    # pin them explicitly so a missing extra fails loudly instead of falling back to asyncio/h11.
+    # uvloop isn't installed where it doesn't build (Windows, Cygwin, PyPy); let uvicorn pick the loop there.
+    # Equivalent CLI: uvicorn app.main:app --loop uvloop --http httptools --workers N
+    settings = get_settings()
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "auto"
+    uvicorn.run("app.main:app", host=settings.host, port=settings.port, loop=loop, http="httptools")
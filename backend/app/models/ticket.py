@@ -1,9 +1,10 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, func
 from sqlalchemy.orm import relationship
 from app.database import Base
 import enum
-import datetime
 
+# Stored as plain strings (the enum values); validated against these enums
+# at the API edge in app.schemas.tickets.
 class TicketStatus(enum.Enum):
     OPEN = "open"
     IN_PROGRESS = "in_progress"
@@ -16,11 +17,14 @@ class TicketPriority(enum.Enum):
 
 class Ticket(Base):
     __tablename__ = "tickets"
+    # fetch server-generated columns (created_at, updated_at) via RETURNING on write
+    __mapper_args__ = {"eager_defaults": True}
     id = Column(Integer, primary_key=True)
     title = Column(String, nullable=False)
     description = Column(String, nullable=False)
-    status = Column(Enum(TicketStatus), default=TicketStatus.OPEN)
-    priority = Column(Enum(TicketPriority), default=TicketPriority.MEDIUM)
-    created_at = Column(DateTime, default=datetime.datetime.utcnow)
-    user_id = Column(Integer, ForeignKey("users.id"))
+    status = Column(String(16), nullable=False, default=TicketStatus.OPEN.value, index=True)
+    priority = Column(String(16), nullable=False, default=TicketPriority.MEDIUM.value)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
     user = relationship("User", back_populates="tickets")
\ No newline at end of file
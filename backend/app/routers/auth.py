@@ -1,5 +1,8 @@
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
 from app.models.user import User
 from app.schemas.auth import UserCreate, Token
@@ -8,23 +11,26 @@ from app.services import auth_service
 router = APIRouter(tags=["auth"])
 
 @router.post("/auth/register", status_code=status.HTTP_201_CREATED)
-def register_user(user_create: UserCreate, db: Session = Depends(get_db)):
-    if db.query(User).filter(User.username == user_create.username).first():
+async def register_user(user_create: UserCreate, db: AsyncSession = Depends(get_db)):
+    # bcrypt is CPU-bound; run it in a worker thread so the event loop stays free
+    hashed_password = await asyncio.to_thread(auth_service.hash_password, user_create.password)
+    # single atomic roundtrip: the unique constraint on username rejects duplicates
+    stmt = (
+        insert(User)
+        .values(username=user_create.username, hashed_password=hashed_password)
+        .on_conflict_do_nothing(index_elements=["username"])
+        .returning(User.id)
+    )
+    user_id = (await db.execute(stmt)).scalar()
+    if user_id is None:
         raise HTTPException(status_code=400, detail="Username already exists")
-    hashed_password = auth_service.hash_password(user_create.password)
-    user = User(
-        username=user_create.username,
-        hashed_password=hashed_password
-        )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
     return {"msg": "User created successfully"}
 
 @router.post("/auth/login", response_model=Token)
-def login_user(user_create: UserCreate, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.username == user_create.username).first()
-    if not user or not auth_service.verify_password(user_create.password, user.hashed_password):
+async def login_user(user_create: UserCreate, db: AsyncSession = Depends(get_db)):
+    user = await db.scalar(select(User).where(User.username == user_create.username))
+    if not user or not await asyncio.to_thread(auth_service.verify_password, user_create.password, user.hashed_password):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     access_token = auth_service.create_access_token(data={"sub": user.username})
-    return {"access_token": access_token, "token_type": "bearer"}
\ No newline at end of file
+    return {"access_token": access_token, "token_type": "bearer"}
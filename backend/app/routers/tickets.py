@@ -1,10 +1,15 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+import hashlib
+from typing import Optional
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import select, update, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload, joinedload, raiseload, load_only
+from app.config import Settings, get_settings
 from app.database import get_db
 from app.models.ticket import Ticket
-from app.models.user import User
-from app.schemas.tickets import TicketCreate, TicketRead, TicketUpdate
+from app.schemas.auth import CurrentUser
+from app.schemas.tickets import TicketCreate, TicketPage, TicketRead, TicketUpdate
 from app.services.auth_service import get_current_user
 
 
@@ -13,51 +18,102 @@ router = APIRouter(
     tags=["tickets"],
 )
 
+# Columns serialized by TicketRead; everything else stays unloaded on read paths.
+TICKET_READ_COLUMNS = (Ticket.id, Ticket.title, Ticket.description, Ticket.status, Ticket.priority, Ticket.created_at)
+
+# Hot-read cache for get_ticket: ticket id -> (TicketRead, ETag); invalidated on update/delete.
+_ticket_cache = TTLCache(maxsize=1024, ttl=30)
+# Bumped on every invalidation so a read that raced a write doesn't re-cache stale data.
+_ticket_cache_generation = 0
+
+
+def _invalidate_ticket(ticket_id: int) -> None:
+    global _ticket_cache_generation
+    _ticket_cache_generation += 1
+    _ticket_cache.pop(ticket_id, None)
+
+
+def _etag(ticket: TicketRead) -> str:
+    # hash of the serialized body, so any change to what the client sees changes the tag
+    digest = hashlib.md5(ticket.model_dump_json().encode(), usedforsecurity=False).hexdigest()
+    return f'"{digest}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    # If-None-Match is a list of (possibly weak) tags or "*"; GET uses weak comparison
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
 
 @router.post("/", response_model=TicketRead, status_code=status.HTTP_201_CREATED)
-def create_ticket(payload: TicketCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+async def create_ticket(payload: TicketCreate, db: AsyncSession = Depends(get_db), current_user: CurrentUser = Depends(get_current_user)):
     ticket = Ticket(
         title=payload.title,
         description=payload.description,
-        status=payload.status,
-        priority=payload.priority,
+        status=payload.status.value,
+        priority=payload.priority.value,
         user_id=current_user.id  # associate ticket to logged-in user
     )
     db.add(ticket)
-    db.commit()
-    db.refresh(ticket)
+    await db.commit()
     return ticket
 
-@router.get("/", response_model=List[TicketRead])
-def list_tickets(db: Session = Depends(get_db)):
-    tickets = db.query(Ticket).all()
-    return tickets
+@router.get("/", response_model=TicketPage)
+async def list_tickets(after: Optional[int] = None, limit: int = Query(50, ge=1, le=200), db: AsyncSession = Depends(get_db), settings: Settings = Depends(get_settings)):
+    # keyset pagination on id DESC: newest first, bounded per request
+    # user_id is kept alongside the read columns as selectinload keys the user batch on it
+    stmt = select(Ticket).options(load_only(*TICKET_READ_COLUMNS, Ticket.user_id), selectinload(Ticket.user)).order_by(Ticket.id.desc()).limit(limit)
+    if after is not None:
+        stmt = stmt.where(Ticket.id < after)
+    if settings.raiseload_strict:
+        # fail fast on any relationship access that would fire an extra query
+        stmt = stmt.options(raiseload("*"))
+    tickets = (await db.execute(stmt)).scalars().all()
+    next_cursor = tickets[-1].id if len(tickets) == limit else None
+    return {"items": tickets, "next_cursor": next_cursor}
 
 @router.get("/{ticket_id}", response_model=TicketRead)
-def get_ticket(ticket_id: int, db: Session = Depends(get_db)):
-    ticket = db.query(Ticket).filter(Ticket.id == ticket_id).first()
-    if not ticket:
-        raise HTTPException(status_code=404, detail="Ticket not found")
-    return ticket
+async def get_ticket(ticket_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_db)):
+    cached = _ticket_cache.get(ticket_id)
+    if cached is None:
+        generation = _ticket_cache_generation
+        ticket = await db.scalar(select(Ticket).options(load_only(*TICKET_READ_COLUMNS), joinedload(Ticket.user)).where(Ticket.id == ticket_id))
+        if not ticket:
+            raise HTTPException(status_code=404, detail="Ticket not found")
+        ticket_read = TicketRead.model_validate(ticket)
+        cached = (ticket_read, _etag(ticket_read))
+        # skip caching if an update/delete invalidated while the SELECT was in flight
+        if generation == _ticket_cache_generation:
+            _ticket_cache[ticket_id] = cached
+
+    ticket_read, etag = cached
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return ticket_read
 
 @router.put("/{ticket_id}", response_model=TicketRead)
-def update_ticket(ticket_id: int, payload: TicketUpdate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    ticket = db.query(Ticket).filter(Ticket.id == ticket_id, Ticket.user_id == current_user.id).first()
+async def update_ticket(ticket_id: int, payload: TicketUpdate, db: AsyncSession = Depends(get_db), current_user: CurrentUser = Depends(get_current_user)):
+    values = payload.model_dump(mode="json", exclude_unset=True, exclude_none=True)
+    owned = (Ticket.id == ticket_id, Ticket.user_id == current_user.id)
+    if values:
+        # single UPDATE ... RETURNING instead of SELECT + UPDATE + refresh
+        ticket = await db.scalar(update(Ticket).where(*owned).values(**values).returning(Ticket))
+    else:
+        ticket = await db.scalar(select(Ticket).where(*owned))
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket not found or not owned by user")
-
-    for key, value in payload.model_dump(exclude_unset=True).items():
-        setattr(ticket, key, value)
-
-    db.commit()
-    db.refresh(ticket)
+    await db.commit()
+    _invalidate_ticket(ticket_id)
     return ticket
 
 @router.delete("/{ticket_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_ticket(ticket_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    ticket = db.query(Ticket).filter(Ticket.id == ticket_id, Ticket.user_id == current_user.id).first()
-    if not ticket:
+async def delete_ticket(ticket_id: int, db: AsyncSession = Depends(get_db), current_user: CurrentUser = Depends(get_current_user)):
+    result = await db.execute(delete(Ticket).where(Ticket.id == ticket_id, Ticket.user_id == current_user.id))
+    await db.commit()
+    _invalidate_ticket(ticket_id)
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Ticket not found or not owned by user")
-    db.delete(ticket)
-    db.commit()
-    return
\ No newline at end of file
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
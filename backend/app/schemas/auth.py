@@ -6,4 +6,11 @@ class UserCreate(BaseModel):
 
 class Token(BaseModel):
     access_token: str
-    token_type: str = 'bearer'
\ No newline at end of file
+    token_type: str = 'bearer'
+
+class CurrentUser(BaseModel):
+    id: int
+    username: str
+    class Config:
+        from_attributes = True
+        frozen = True # immutable snapshot, safe to share across requests
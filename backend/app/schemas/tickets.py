@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from app.models.ticket import TicketStatus, TicketPriority
 
@@ -22,4 +22,8 @@ class TicketRead(TicketBase):
     id: int
     created_at: datetime
     class Config:
-        from_attributes = True # allows readiing orm models directly
\ No newline at end of file
+        from_attributes = True # allows readiing orm models directly
+
+class TicketPage(BaseModel):
+    items: List[TicketRead]
+    next_cursor: Optional[int] = None # pass as ?after= to fetch the next page
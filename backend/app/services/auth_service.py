@@ -1,17 +1,33 @@
+import logging
+from cachetools import TTLCache
 from passlib.context import CryptContext
 from datetime import datetime, timedelta
-from jose import jwt, JWTError
+import jwt
+from jwt import InvalidTokenError as JWTError
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
 from app.models.user import User
+from app.schemas.auth import CurrentUser
+
+logger = logging.getLogger(__name__)
 
 # Secret key . normally from env config.
 SECRET_KEY = "your_secret_key"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
 
+# Built once instead of on every encode/decode call.
+_ALGS = (ALGORITHM,)
+_DECODE_OPTS = {"require": ["exp", "sub"], "verify_aud": False}
+_DEFAULT_DELTA = timedelta(minutes=15)
+
+# Authenticated user snapshots keyed on their token's signature segment, so hot tokens
+# skip the user SELECT. Tokens are still verified on every request.
+_user_cache = TTLCache(maxsize=10_000, ttl=60)
+
 
 oauth2_scheme = HTTPBearer()
 
@@ -24,14 +40,12 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 def create_access_token(data: dict, expires_delta: timedelta = None):
-    to_encode = data.copy()
-    expire = datetime.utcnow() + (expires_delta if expires_delta else timedelta(minutes=15))
-    to_encode.update({"exp": expire})
+    to_encode = {**data, "exp": datetime.utcnow() + (expires_delta or _DEFAULT_DELTA)}
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
-def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)) -> CurrentUser:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -39,21 +53,29 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(oauth2_
     )
     
     token = credentials.credentials  # Extract the actual token string
-    print(f"Received token: {token}")  # Debug
     
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        print(f"Decoded payload: {payload}")  # Debug
+        payload = jwt.decode(token, SECRET_KEY, algorithms=_ALGS, options=_DECODE_OPTS)
         username: str = payload.get("sub")
+        # never log the token or full payload; the subject is enough to trace a request
+        logger.debug("Decoded token for sub: %s", username)
         if username is None:
             raise credentials_exception
     except JWTError as e:
-        print(f"JWT Error: {e}")  # Debug
+        logger.debug("JWT Error: %s", e)
         raise credentials_exception
     
-    user = db.query(User).filter(User.username == username).first()
-    print(f"Found user: {user}")  # Debug
+    signature = token.rsplit(".", 1)[-1]
+    user = _user_cache.get(signature)
+    if user is not None:
+        return user
+
+    user = await db.scalar(select(User).where(User.username == username))
+    logger.debug("Found user: %s", user)
     if user is None:
         raise credentials_exception
+    # cache a detached snapshot, never the session-bound ORM instance
+    current_user = CurrentUser.model_validate(user)
+    _user_cache[signature] = current_user
 
-    return user
\ No newline at end of file
+    return current_user
\ No newline at end of file
@@ -1,18 +1,24 @@
-from app.database import SessionLocal
+import asyncio
+from sqlalchemy import select
+from app.database import async_session
 from app.models.user import User
 from app.models.ticket import Ticket
 
-db = SessionLocal()
-# Example hash -- in a real app, hash properly
-new_user = User(username="testuser", hashed_password="fakehashed")
-db.add(new_user)
-db.commit()
 
-new_ticket = Ticket(title="Sample Ticket", description="Issue description", user_id=new_user.id)
-db.add(new_ticket)
-db.commit()
+async def main():
+    async with async_session() as db:
+        # Example hash -- in a real app, hash properly
+        new_user = User(username="testuser", hashed_password="fakehashed")
+        db.add(new_user)
+        await db.commit()
 
-user = db.query(User).first()
-ticket = db.query(Ticket).first()
-print(f"Inserted User: {user.username}, Ticket: {ticket.title}")
-db.close()
+        new_ticket = Ticket(title="Sample Ticket", description="Issue description", user_id=new_user.id)
+        db.add(new_ticket)
+        await db.commit()
+
+        user = await db.scalar(select(User))
+        ticket = await db.scalar(select(Ticket))
+        print(f"Inserted User: {user.username}, Ticket: {ticket.title}")
+
+
+asyncio.run(main())
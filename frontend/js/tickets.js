@@ -33,6 +33,11 @@ const ticketsList = document.getElementById("tickets-list");
 const loadingState = document.getElementById("loading-state");
 const emptyState = document.getElementById("empty-state");
 const logoutLink = document.getElementById("logout-link");
+const loadMore = document.getElementById("load-more");
+const loadMoreBtn = document.getElementById("load-more-btn");
+
+// Cursor for the next page of tickets (null when there are no more pages)
+let nextCursor = null;
 
 
 // ===========================================
@@ -179,6 +184,7 @@ function showState(state) {
     loadingState.classList.add("hidden");
     emptyState.classList.add("hidden");
     ticketsList.classList.add("hidden");
+    loadMore.classList.add("hidden");
     
     // Show the requested state
     switch (state) {
@@ -190,6 +196,10 @@ function showState(state) {
             break;
         case "list":
             ticketsList.classList.remove("hidden");
+            // Only offer "Load more" while the API reports another page
+            if (nextCursor !== null) {
+                loadMore.classList.remove("hidden");
+            }
             break;
     }
 }
@@ -241,26 +251,37 @@ function handleLogout(event) {
 
 /**
  * Fetch and display tickets from the API
+ * @param {number|null} after - Cursor from the previous page, or null for the first page
  * 
  * This is the main function that:
  * 1. Checks authentication
- * 2. Shows loading state
- * 3. Fetches tickets from API
+ * 2. Shows loading state (first page only)
+ * 3. Fetches one page of tickets from the API
  * 4. Creates HTML for each ticket
- * 5. Handles errors appropriately
+ * 5. Shows "Load more" while the API reports more pages
+ * 6. Handles errors appropriately
  */
-async function loadTickets() {
+async function loadTickets(after = null) {
     // STEP 1: Check if user is logged in
     const token = checkAuth();
     if (!token) return;  // checkAuth will redirect if not logged in
     
     // STEP 2: Show loading state
-    showState("loading");
+    // For later pages we keep the list visible and just disable the button
+    if (after === null) {
+        showState("loading");
+    } else {
+        loadMoreBtn.disabled = true;
+    }
     
     try {
-        // STEP 3: Fetch tickets from the API
+        // STEP 3: Fetch a page of tickets from the API
         // We include the Authorization header with our token
-        const response = await fetch(`${API_BASE_URL}/api/tickets/`, {
+        // ?after=<cursor> asks for the tickets that come after the previous page
+        const url = after === null
+            ? `${API_BASE_URL}/api/tickets/`
+            : `${API_BASE_URL}/api/tickets/?after=${after}`;
+        const response = await fetch(url, {
             method: "GET",
             headers: {
                 // Bearer token authentication
@@ -284,17 +305,21 @@ async function loadTickets() {
         }
         
         // STEP 6: Parse the JSON response
-        // The API returns an array of ticket objects
-        const tickets = await response.json();
+        // The API returns a page: { items: [...tickets], next_cursor }
+        const page = await response.json();
+        const tickets = page.items;
+        nextCursor = page.next_cursor;
         
-        // STEP 7: Check if there are any tickets
-        if (tickets.length === 0) {
+        // STEP 7: Check if there are any tickets at all
+        if (after === null && tickets.length === 0) {
             showState("empty");
             return;
         }
         
-        // STEP 8: Clear any existing tickets in the list
-        ticketsList.innerHTML = "";
+        // STEP 8: Clear any existing tickets when loading the first page
+        if (after === null) {
+            ticketsList.innerHTML = "";
+        }
         
         // STEP 9: Create and append elements for each ticket
         // forEach() loops through each item in the array
@@ -315,12 +340,20 @@ async function loadTickets() {
         console.error("Error loading tickets:", error);
         
         // Show an error message to the user
-        ticketsList.innerHTML = `
+        const errorHtml = `
             <li class="ticket-item" style="justify-content: center; color: var(--danger-color);">
                 Error loading tickets. Please try again.
             </li>
         `;
+        if (after === null) {
+            ticketsList.innerHTML = errorHtml;
+        } else {
+            // Keep the tickets already shown; the button stays so the user can retry
+            ticketsList.insertAdjacentHTML("beforeend", errorHtml);
+        }
         showState("list");
+    } finally {
+        loadMoreBtn.disabled = false;
     }
 }
 
@@ -334,6 +367,11 @@ if (logoutLink) {
     logoutLink.addEventListener("click", handleLogout);
 }
 
+// Fetch the next page when "Load more" is clicked
+if (loadMoreBtn) {
+    loadMoreBtn.addEventListener("click", () => loadTickets(nextCursor));
+}
+
 
 // ===========================================
 // INITIALIZATION